@@ -9,6 +9,12 @@ from typing import Optional
 class Album:
     """Class representing a musical album."""
     
+    # Albums are held in bulk by the table model, so avoid a per-instance
+    # __dict__. The trailing names are optional fields set by importers.
+    __slots__ = ("artist", "name", "release_date", "genre1", "genre2", "comment",
+                 "cover_image", "cover_image_data", "cover_image_format",
+                 "album_id", "country", "rank", "points")
+    
     def __init__(self, artist: str, name: str, release_date: date,
                  genre1: str, genre2: str = "", comment: str = "", 
                  cover_image: Optional[str] = None, cover_image_data: Optional[str] = None,
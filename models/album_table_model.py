@@ -2,15 +2,44 @@
 Album table model for QTableView
 """
 
+from enum import IntEnum
+from operator import attrgetter
 from typing import List, Optional, Any
 
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QMimeData
 from models.album import Album
 
+# Item data roles and cell alignment, resolved once instead of per data() call
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_CELL_ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+
+class Column(IntEnum):
+    """Column indexes of the album table, in display order."""
+    ALBUM = 0
+    ARTIST = 1
+    RELEASE_DATE = 2
+    GENRE1 = 3
+    GENRE2 = 4
+    COMMENT = 5
+
 
 class AlbumTableModel(QAbstractTableModel):
     """Table model for displaying and managing albums."""
     
+    # Display text getters, indexed by column. Also used by the album table
+    # delegate, so painted text and DisplayRole data never drift apart.
+    DISPLAY_GETTERS = (
+        attrgetter("name"),
+        attrgetter("artist"),
+        # isoformat gives the same YYYY-MM-DD text without parsing a format string
+        lambda album: album.release_date.isoformat(),
+        attrgetter("genre1"),
+        attrgetter("genre2"),
+        attrgetter("comment"),
+    )
+    
     def __init__(self, albums: List[Album] = None):
         """
         Initialize the album table model.
@@ -20,7 +49,7 @@ class AlbumTableModel(QAbstractTableModel):
         """
         super().__init__()
         self.albums = albums or []
-        self.headers = ["Artist", "Album", "Release Date", "Genre 1", "Genre 2", "Comment"]
+        self.headers = ["Album", "Artist", "Release Date", "Genre 1", "Genre 2", "Comment"]
     
     def rowCount(self, parent=QModelIndex()) -> int:
         """Return the number of rows in the model."""
@@ -47,22 +76,12 @@ class AlbumTableModel(QAbstractTableModel):
         album = self.albums[index.row()]
         col = index.column()
         
-        if role == Qt.ItemDataRole.DisplayRole:
-            if col == 0:
-                return album.artist
-            elif col == 1:
-                return album.name
-            elif col == 2:
-                return album.release_date.strftime("%Y-%m-%d")
-            elif col == 3:
-                return album.genre1
-            elif col == 4:
-                return album.genre2
-            elif col == 5:
-                return album.comment
-        
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        if role == _DISPLAY_ROLE:
+            if col < len(self.DISPLAY_GETTERS):
+                return self.DISPLAY_GETTERS[col](album)
+        
+        elif role == _ALIGNMENT_ROLE:
+            return _CELL_ALIGNMENT
         
         return None
     
@@ -79,7 +98,7 @@ class AlbumTableModel(QAbstractTableModel):
         Returns:
             The requested header data or None if not available
         """
-        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+        if orientation == Qt.Orientation.Horizontal and role == _DISPLAY_ROLE:
             return self.headers[section]
         return None
     
@@ -168,17 +187,31 @@ class AlbumTableModel(QAbstractTableModel):
         if source_row == target_row or source_row == target_row - 1:
             return False
         
-        self.beginResetModel()
+        # Move the single row in place so views keep selection and scroll state
+        if not self.beginMoveRows(QModelIndex(), source_row, source_row,
+                                  QModelIndex(), target_row):
+            return False
         album = self.albums.pop(source_row)
         
         if source_row < target_row:
             target_row -= 1
         
         self.albums.insert(target_row, album)
-        self.endResetModel()
+        self.endMoveRows()
         
         return True
 
+    def set_albums(self, albums: List[Album]) -> None:
+        """
+        Replace all albums in the model with a single reset.
+        
+        Args:
+            albums: The new list of Album objects
+        """
+        self.beginResetModel()
+        self.albums = albums
+        self.endResetModel()
+    
     def add_album(self, album: Album) -> None:
         """
         Add an album to the model.
@@ -5,16 +5,19 @@ This package contains all resources used by the application such as icons,
 stylesheets, and other static assets.
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=64)
 def get_resource_path(relative_path: str) -> str:
     """
     Get the absolute path to a resource file.
     
     This function handles both development and frozen (packaged) environments.
+    The base path can't change while the application runs, so results are cached.
     
     Args:
         relative_path: The path relative to the resources directory
@@ -39,10 +42,14 @@ def get_resource_path(relative_path: str) -> str:
     return str(base_path / 'resources' / relative_path)
 
 
+@functools.lru_cache(maxsize=64)
 def resource_exists(relative_path: str) -> bool:
     """
     Check if a resource file exists.
     
+    Bundled resources are fixed at runtime, so the filesystem is only
+    checked once per path.
+    
     Args:
         relative_path: The path relative to the resources directory
         
@@ -8,6 +8,7 @@ This module handles importing, exporting, and managing album lists.
 import os
 import json
 import base64
+import functools
 import traceback
 from datetime import datetime, date
 from typing import List, Dict, Any, Tuple
@@ -37,8 +38,9 @@ class AlbumListManager:
             covers_directory: Directory to store album cover images
         """
         log.debug(f"Initializing AlbumListManager with covers directory: {covers_directory}")
+        # Covers are embedded in the list files, so the directory is only
+        # created by code that actually writes a cover file to it
         self.covers_directory = covers_directory
-        os.makedirs(covers_directory, exist_ok=True)
     
     def import_from_new_format(self, file_path: str) -> Tuple[List[Album], Dict[str, Any]]:
         """
@@ -124,7 +126,6 @@ class AlbumListManager:
                     album.points = album_data["points"]
                 
                 albums.append(album)
-                log.debug(f"Imported album: {album.artist} - {album.name}")
             
             log.info(f"Successfully imported {len(albums)} albums from {file_path}")
             return albums, metadata
@@ -198,7 +199,6 @@ class AlbumListManager:
                 "country": getattr(album, "country", "")
             }
             data["albums"].append(album_data)
-            log.debug(f"Added album to export: {album.artist} - {album.name}")
         
         # Save the data to the file
         try:
@@ -216,30 +216,12 @@ class AlbumListManager:
 
     def _load_points_mapping(self) -> Dict[str, int]:
         """
-        Load the points mapping from the resources file.
+        Get the points mapping from the resources file.
         
         Returns:
             A dictionary mapping rank (as string) to points
         """
-        log.debug("Loading points mapping")
-        try:
-            # Try to load the points mapping from the resources directory
-            from resources import get_resource_path
-            points_path = get_resource_path("points.json")
-            
-            with open(points_path, 'r', encoding='utf-8') as f:
-                mapping = json.load(f)
-                log.debug(f"Loaded points mapping from {points_path}")
-                return mapping
-        except Exception as e:
-            # If there's an error, use a default mapping
-            log.warning(f"Could not load points mapping: {e}")
-            log.debug(traceback.format_exc())
-            log.info("Using default points mapping (rank = points)")
-            
-            # Default mapping: rank = points
-            default_mapping = {str(i): max(1, 61-i) for i in range(1, 61)}
-            return default_mapping
+        return _load_points_mapping()
     
     def import_from_new_format(self, file_path: str) -> Tuple[List[Album], Dict[str, Any]]:
         """
@@ -306,7 +288,6 @@ class AlbumListManager:
                     album.points = album_data["points"]
                 
                 albums.append(album)
-                log.debug(f"Imported album: {album.artist} - {album.name}")
             
             log.info(f"Successfully imported {len(albums)} albums from {file_path}")
             return albums, metadata
@@ -317,6 +298,38 @@ class AlbumListManager:
             raise ImportError(f"Failed to import album list: {e}")
 
 
+@functools.lru_cache(maxsize=1)
+def _load_points_mapping() -> Dict[str, int]:
+    """
+    Load the points mapping from the resources file.
+    
+    The file is static for the lifetime of the application, so it is read
+    once and reused by every export instead of being re-read each time.
+    
+    Returns:
+        A dictionary mapping rank (as string) to points
+    """
+    log.debug("Loading points mapping")
+    try:
+        # Try to load the points mapping from the resources directory
+        from resources import get_resource_path
+        points_path = get_resource_path("points.json")
+        
+        with open(points_path, 'r', encoding='utf-8') as f:
+            mapping = json.load(f)
+            log.debug(f"Loaded points mapping from {points_path}")
+            return mapping
+    except Exception as e:
+        # If there's an error, use a default mapping
+        log.warning(f"Could not load points mapping: {e}")
+        log.debug(traceback.format_exc())
+        log.info("Using default points mapping (rank = points)")
+        
+        # Default mapping: rank = points
+        default_mapping = {str(i): max(1, 61-i) for i in range(1, 61)}
+        return default_mapping
+
+
 class ImportError(Exception):
     """Exception raised when importing an album list fails."""
     pass
@@ -72,8 +72,20 @@ class Config:
             value: The value to set
         """
         log.debug(f"Config set: {key} = {value}")
+        # QSettings writes pending changes to disk from the event loop and
+        # on destruction, so back-to-back sets share one write
         self.settings.setValue(key, value)
-        self.settings.sync()
+    
+    def set_many(self, values: Dict[str, Any]) -> None:
+        """
+        Set several configuration values.
+        
+        Args:
+            values: Mapping of configuration keys to the values to set
+        """
+        log.debug(f"Config set many: {values}")
+        for key, value in values.items():
+            self.settings.setValue(key, value)
     
     def get_default(self, key_path: str) -> Any:
         """
@@ -114,6 +126,11 @@ class Config:
             log.warning("Recent files not a list, resetting")
             recent_files = []
         
+        # Nothing to write if the file is already the most recent one
+        if recent_files and recent_files[0] == filepath and len(recent_files) <= max_entries:
+            log.debug("File already most recent, recent files unchanged")
+            return
+        
         # Remove the file if it already exists in the list
         if filepath in recent_files:
             log.debug("File already in recent files, moving to top")
@@ -125,7 +142,7 @@ class Config:
         # Trim the list to the maximum number of entries
         if len(recent_files) > max_entries:
             log.debug(f"Trimming recent files list to {max_entries} entries")
-            recent_files = recent_files[:max_entries]
+            del recent_files[max_entries:]
         
         # Save the updated list
         self.set("recent_files", recent_files)
@@ -44,6 +44,9 @@ class SimpleCollectionManager:
         self.metadata_path = os.path.join(self.app_dir, "metadata.json")
         self.metadata = self._load_metadata()
         
+        # List info by file path, with the (mtime, size) it was read at
+        self._list_info_cache = {}
+        
         # Create a default collection if none exists
         if not os.listdir(self.collections_dir):
             log.info("No collections found, creating default collection")
@@ -99,6 +102,27 @@ class SimpleCollectionManager:
             log.error(f"Error saving metadata: {e}")
             log.debug(traceback.format_exc())
     
+    def _touch_recent_list(self, file_path):
+        """
+        Move a list to the front of the recent lists and save the metadata.
+        
+        Re-saving or reopening the list that is already most recent leaves
+        the order unchanged, so the metadata file is not rewritten then.
+        
+        Args:
+            file_path: Path to the list file
+        """
+        recent_lists = self.metadata["recent_lists"]
+        if recent_lists and recent_lists[0] == file_path:
+            log.debug("List is already the most recent, metadata unchanged")
+            return
+        
+        if file_path in recent_lists:
+            recent_lists.remove(file_path)
+        recent_lists.insert(0, file_path)
+        del recent_lists[10:]
+        self._save_metadata()
+    
     def get_collections(self):
         """
         Get all collections as a dictionary of collection_name -> list of list_info.
@@ -130,6 +154,22 @@ class SimpleCollectionManager:
         
         return collections
     
+    def get_collection_names(self):
+        """
+        Get the names of all collections.
+        
+        Unlike get_collections, this only lists the collection directories
+        and does not open any list files.
+        
+        Returns:
+            A list of collection names
+        """
+        log.debug("Getting collection names")
+        return [
+            name for name in os.listdir(self.collections_dir)
+            if os.path.isdir(os.path.join(self.collections_dir, name))
+        ]
+    
     def get_recent_lists(self, limit=5):
         """
         Get the most recently accessed lists.
@@ -156,21 +196,51 @@ class SimpleCollectionManager:
         log.debug(f"Returning {len(recent_lists)} recent lists")
         return recent_lists
     
-    def _get_list_info(self, file_path):
+    def get_list_info(self, file_path, stats=None):
+        """
+        Get basic info about a list, such as its title and display name.
+        
+        Info is cached per file and only re-read once the file changes,
+        so callers can look lists up by path as often as they need.
+        
+        Args:
+            file_path: Path to the list file
+            stats: os.stat result for the file, if the caller already has one
+            
+        Returns:
+            A dictionary with list information or None if the file cannot be read
+        """
+        return self._get_list_info(file_path, stats)
+    
+    def _get_list_info(self, file_path, stats=None):
         """
         Get basic info about a list without loading all albums.
         
         Args:
             file_path: Path to the list file
+            stats: os.stat result for the file, if the caller already has one
             
         Returns:
             A dictionary with list information or None if the file cannot be read
         """
-        if not os.path.exists(file_path):
+        try:
+            if stats is None:
+                stats = os.stat(file_path)
+        except OSError:
+            # Forget deleted or renamed lists so the cache doesn't keep them
+            self._list_info_cache.pop(file_path, None)
             log.warning(f"List file not found: {file_path}")
             return None
             
         try:
+            # Reuse the info if the file hasn't changed since it was read,
+            # since reading it means parsing every album and its cover.
+            # Callers get a copy so they can't change the cached info.
+            file_version = (stats.st_mtime_ns, stats.st_size)
+            cached = self._list_info_cache.get(file_path)
+            if cached is not None and cached[0] == file_version:
+                return dict(cached[1])
+            
             log.debug(f"Getting list info for: {file_path}")
             
             with open(file_path, "r", encoding="utf-8") as f:
@@ -201,20 +271,25 @@ class SimpleCollectionManager:
                 return None
             
             # Get file stats
-            stats = os.stat(file_path)
             modified_time = datetime.fromtimestamp(stats.st_mtime).isoformat()
             
+            title = metadata.get("title", "Untitled List")
+            collection = self.get_collection_for_list(file_path)
+            
             list_info = {
                 "file_path": file_path,
                 "file_name": os.path.basename(file_path),
-                "title": metadata.get("title", "Untitled List"),
+                "title": title,
+                # Menu label, computed once here rather than by every caller
+                "display_name": f"{title} ({collection})" if collection else title,
                 "album_count": album_count,
                 "date_modified": modified_time,
-                "collection": self.get_collection_for_list(file_path)
+                "collection": collection
             }
             
             log.debug(f"Retrieved info for list: {list_info['title']}")
-            return list_info
+            self._list_info_cache[file_path] = (file_version, list_info)
+            return dict(list_info)
         except Exception as e:
             log.error(f"Error reading list file {file_path}: {e}")
             log.debug(traceback.format_exc())
@@ -300,12 +375,7 @@ class SimpleCollectionManager:
                 json.dump(data, f, indent=2)
             
             # Update recent files
-            if file_path in self.metadata["recent_lists"]:
-                self.metadata["recent_lists"].remove(file_path)
-            self.metadata["recent_lists"].insert(0, file_path)
-            self.metadata["recent_lists"] = self.metadata["recent_lists"][:10]
-            
-            self._save_metadata()
+            self._touch_recent_list(file_path)
             log.info(f"Album list saved to {file_path}")
             return file_path
         except Exception as e:
@@ -359,11 +429,7 @@ class SimpleCollectionManager:
                 albums.append(self._dict_to_album(album_data))
             
             # Update recent lists
-            if file_path in self.metadata["recent_lists"]:
-                self.metadata["recent_lists"].remove(file_path)
-            self.metadata["recent_lists"].insert(0, file_path)
-            self.metadata["recent_lists"] = self.metadata["recent_lists"][:10]
-            self._save_metadata()
+            self._touch_recent_list(file_path)
             
             # Add collection information to metadata
             collection_name = self.get_collection_for_list(file_path)
@@ -387,6 +453,11 @@ class SimpleCollectionManager:
         Returns:
             Collection name or None if not in a collection
         """
+        # Lists saved by this manager sit directly in a collection directory
+        collection_path = os.path.dirname(os.path.normpath(file_path))
+        if os.path.dirname(collection_path) == os.path.normpath(self.collections_dir):
+            return os.path.basename(collection_path)
+
         # Extract collection name from path
         path_parts = os.path.normpath(file_path).split(os.sep)
         for i, part in enumerate(path_parts):
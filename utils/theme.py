@@ -2,6 +2,8 @@
 Theme utilities for the application with more accurate Spotify styling.
 """
 
+from typing import Optional
+
 from PyQt6.QtGui import QPalette, QColor, QFont, QBrush
 from PyQt6.QtWidgets import QApplication, QMainWindow, QTableView, QStatusBar, QMenuBar
 
@@ -23,12 +25,14 @@ class SpotifyTheme:
     ACTIVE = QColor(80, 80, 80)            # #505050 - Selected items
 
     @classmethod
-    def apply_to_window(cls, window: QMainWindow) -> None:
+    def apply_to_window(cls, window: QMainWindow, stylesheet: Optional[str] = None) -> None:
         """
         Apply the Spotify theme to a specific window.
         
         Args:
             window: The QMainWindow instance
+            stylesheet: Stylesheet to apply to the window instead of the
+                global one (optional)
         """
         # Create and apply a dark palette
         palette = cls.create_palette()
@@ -38,8 +42,10 @@ class SpotifyTheme:
         font = QFont("Segoe UI", 10)
         window.setFont(font)
         
-        # Apply global stylesheet
-        window.setStyleSheet(cls.get_global_stylesheet())
+        # Apply global stylesheet, unless the window brings its own
+        if stylesheet is None:
+            stylesheet = cls.get_global_stylesheet()
+        window.setStyleSheet(stylesheet)
         
         # Apply stylesheets to specific components
         cls.style_menu_bar(window.menuBar())
@@ -5,7 +5,7 @@ Dialog for selecting or creating a collection for a list.
 """
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-                           QListWidget, QListWidgetItem, QLineEdit, 
+                           QListWidget, QLineEdit, 
                            QDialogButtonBox)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
@@ -15,6 +15,56 @@ from utils.logging_utils import get_module_logger
 # Get module logger
 log = get_module_logger()
 
+# Header font shared by all dialog instances
+_HEADER_FONT = QFont("Segoe UI", 12)
+
+# Dark theme stylesheet shared by all dialog instances
+_DIALOG_STYLESHEET = """
+    QDialog {
+        background-color: #121212;
+        color: #FFFFFF;
+    }
+    QLabel {
+        color: #FFFFFF;
+    }
+    QListWidget {
+        background-color: #282828;
+        color: #FFFFFF;
+        border-radius: 4px;
+        border: none;
+    }
+    QListWidget::item {
+        height: 30px;
+        padding: 4px 8px;
+    }
+    QListWidget::item:selected {
+        background-color: #333333;
+    }
+    QListWidget::item:hover {
+        background-color: #333333;
+    }
+    QLineEdit {
+        background-color: #333333;
+        color: #FFFFFF;
+        border-radius: 4px;
+        padding: 8px;
+        border: 1px solid #444444;
+    }
+    QPushButton {
+        background-color: #1DB954;
+        color: #FFFFFF;
+        border-radius: 4px;
+        padding: 8px 16px;
+        border: none;
+    }
+    QPushButton:hover {
+        background-color: #1ED760;
+    }
+    QPushButton#cancelButton {
+        background-color: #333333;
+    }
+"""
+
 class CollectionSelectionDialog(QDialog):
     """Dialog for selecting a collection when creating or saving a list."""
     
@@ -37,48 +87,7 @@ class CollectionSelectionDialog(QDialog):
         self.setMinimumWidth(350)
         
         # Set dark theme styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #121212;
-                color: #FFFFFF;
-            }
-            QLabel {
-                color: #FFFFFF;
-            }
-            QListWidget {
-                background-color: #282828;
-                color: #FFFFFF;
-                border-radius: 4px;
-                border: none;
-            }
-            QListWidget::item {
-                height: 30px;
-                padding: 4px 8px;
-            }
-            QListWidget::item:selected {
-                background-color: #333333;
-            }
-            QListWidget::item:hover {
-                background-color: #333333;
-            }
-            QLineEdit {
-                background-color: #333333;
-                color: #FFFFFF;
-                border-radius: 4px;
-                padding: 8px;
-                border: 1px solid #444444;
-            }
-            QPushButton {
-                background-color: #1DB954;
-                color: #FFFFFF;
-                border-radius: 4px;
-                padding: 8px 16px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #1ED760;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_STYLESHEET)
         
         # Create the layout
         layout = QVBoxLayout(self)
@@ -86,7 +95,7 @@ class CollectionSelectionDialog(QDialog):
         
         # Add title
         header_label = QLabel(message)
-        header_label.setFont(QFont("Segoe UI", 12))
+        header_label.setFont(_HEADER_FONT)
         layout.addWidget(header_label)
         
         # Existing collections section
@@ -98,9 +107,10 @@ class CollectionSelectionDialog(QDialog):
             # Collection list
             self.collection_list = QListWidget()
             self.collection_list.setMaximumHeight(150)
-            for name in collection_names:
-                item = QListWidgetItem(name)
-                self.collection_list.addItem(item)
+            # Every row has the same height, so the view can lay out only
+            # the visible rows instead of measuring each item
+            self.collection_list.setUniformItemSizes(True)
+            self.collection_list.addItems(collection_names)
             
             # Select the first item by default
             if collection_names:
@@ -123,7 +133,7 @@ class CollectionSelectionDialog(QDialog):
         button_layout = QHBoxLayout()
         
         self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.setStyleSheet("background-color: #333333;")
+        self.cancel_button.setObjectName("cancelButton")
         self.cancel_button.clicked.connect(self.reject)
         
         self.ok_button = QPushButton("Confirm")
@@ -4,6 +4,8 @@ views/enhanced_drag_drop.py
 Enhanced drag and drop functionality for table views.
 """
 
+import functools
+
 from PyQt6.QtGui import (QDrag, QPainter, QPixmap, QColor, QBrush, QPen, QFont, 
                     QFontMetrics, QLinearGradient, QImage)
 from PyQt6.QtCore import Qt, QMimeData, QByteArray, QSize, QPoint, QModelIndex, QRect, QEvent
@@ -15,17 +17,109 @@ from utils.logging_utils import get_module_logger
 log = get_module_logger()
 
 
+# Drag preview fonts, shared by every drag instead of rebuilt per row
+_PREVIEW_FONT = QFont("Segoe UI", 10)
+_PREVIEW_BOLD_FONT = QFont("Segoe UI", 10, QFont.Weight.Bold)
+_PREVIEW_SMALL_FONT = QFont("Segoe UI", 9, QFont.Weight.Normal)
+
+# Drag preview row colors, shared by every drag instead of allocated per row
+_PREVIEW_NOTE_COLOR = QColor(200, 200, 200)
+_PREVIEW_NAME_COLOR = QColor(255, 255, 255)
+
+# Rendered placeholder glyph icons, keyed by (char, color rgba, size)
+_glyph_cache = {}
+
+
+def _glyph_pixmap(char, color, size):
+    """
+    Get a round placeholder icon with a glyph drawn in its center.
+    
+    The icon is the same for every row of every drag preview, so it is
+    painted once per glyph, color and size and then reused.
+    
+    Args:
+        char: The glyph to draw
+        color: The QColor of the glyph
+        size: The width and height of the icon
+        
+    Returns:
+        QPixmap with the icon
+    """
+    key = (char, color.rgba(), size)
+    pixmap = _glyph_cache.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(QColor(60, 60, 60)))
+        painter.drawEllipse(0, 0, size, size)
+        painter.setPen(QPen(color))
+        painter.setFont(_PREVIEW_FONT)
+        painter.drawText(QRect(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, char)
+        painter.end()
+        
+        _glyph_cache[key] = pixmap
+    return pixmap
+
+
+@functools.lru_cache(maxsize=1)
+def _simple_drag_preview():
+    """
+    Get the plain "Moving selection..." drag preview.
+    
+    The preview doesn't depend on what is dragged, so it is painted once
+    and reused for every drag without album names.
+    
+    Returns:
+        QPixmap with the drag preview
+    """
+    pixmap = QPixmap(300, 70)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QBrush(QColor(40, 40, 40, 230)))
+    painter.setPen(QPen(QColor(29, 185, 84), 2))
+    painter.drawRoundedRect(0, 0, 300, 70, 10, 10)
+    painter.setPen(QPen(QColor(255, 255, 255)))
+    painter.setFont(_PREVIEW_BOLD_FONT)
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "Moving selection...")
+    painter.end()
+    return pixmap
+
+
 def apply_drag_drop_enhancements(table_view, table_model, table_delegate):
     """
     Apply drag and drop enhancements to the table components.
     
+    Safe to call every time a new model is set on the view: the view is
+    only patched once, and the delegate keeps painting cells itself.
+    
     Args:
         table_view: The QTableView instance
         table_model: The AlbumTableModel instance
-        table_delegate: The AlbumTableDelegate instance
+        table_delegate: The AlbumTableDelegate instance (left unpatched)
     """
     log.debug("Applying drag and drop enhancements")
     
+    if not getattr(table_model, "drag_drop_enhanced", False):
+        _enhance_table_model(table_model)
+    
+    if not getattr(table_view, "drag_drop_enhanced", False):
+        _enhance_table_view(table_view)
+    
+    log.debug("Drag and drop enhancements applied")
+
+
+def _enhance_table_model(table_model):
+    """
+    Patch a table model with the enhanced drag and drop methods.
+    
+    Args:
+        table_model: The AlbumTableModel instance
+    """
     # 1. Enhance the table model's mime data method
     table_model.original_mime_data = table_model.mimeData
     table_model.mimeData = lambda indexes: enhanced_mime_data(table_model, indexes)
@@ -39,6 +133,16 @@ def apply_drag_drop_enhancements(table_view, table_model, table_delegate):
     table_model.dropMimeData = lambda data, action, row, column, parent: enhanced_drop_mime_data(
         table_model, data, action, row, column, parent)
     
+    table_model.drag_drop_enhanced = True
+
+
+def _enhance_table_view(table_view):
+    """
+    Patch a table view with the enhanced drag and drop behavior.
+    
+    Args:
+        table_view: The QTableView instance
+    """
     # 4. Override the startDrag method in the table view
     table_view.startDrag = lambda supportedActions: start_drag(table_view, supportedActions)
     table_view.create_drag_preview = lambda album_names: create_drag_preview(table_view, album_names)
@@ -46,31 +150,17 @@ def apply_drag_drop_enhancements(table_view, table_model, table_delegate):
     # Add property to track drag state
     table_view.isDragInProgress = False
     
-    # 5. Enhance the delegate's paint method with drag handles
-    # Store a reference to the original paint method outside the delegate to avoid recursion
-    original_paint = table_delegate.paint
-    
-    # Create a wrapper function that will call our enhanced method
-    def paint_wrapper(painter, option, index):
-        paint_with_drag_handle(table_delegate, painter, option, index, original_paint)
-    
-    # Replace the paint method with our wrapper
-    table_delegate.paint = paint_wrapper
-    
-    # 6. Configure table view for improved drag and drop experience
+    # 5. Configure table view for improved drag and drop experience
     table_view.setDragDropMode(QAbstractItemView.DragDropMode.DragDrop)
     table_view.setDefaultDropAction(Qt.DropAction.MoveAction)
     table_view.setDragEnabled(True)
     table_view.setAcceptDrops(True)
     table_view.setDropIndicatorShown(True)
     
-    # 7. Enable multiple selection for dragging multiple items
+    # 6. Enable multiple selection for dragging multiple items
     table_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
     
-    # 8. Add hover tracking for drag handle indicators
-    table_view.setMouseTracking(True)
-    
-    log.debug("Drag and drop enhancements applied")
+    table_view.drag_drop_enhanced = True
 
 
 def enhanced_mime_data(self, indexes):
@@ -92,20 +182,17 @@ def enhanced_mime_data(self, indexes):
         log.debug("No valid rows for drag operation")
         return mime_data
     
-    # Store row indices as before
-    encoded_data = QByteArray()
-    for row in rows:
-        encoded_data.append(str(row).encode())
+    # Store row indices as before, built as one string
+    encoded_data = QByteArray("".join(str(row) for row in rows).encode())
     mime_data.setData("application/x-album-row", encoded_data)
     
     # Store the number of rows being dragged
     mime_data.setData("application/x-album-count", QByteArray(str(len(rows)).encode()))
     
     # If we have album data, store the album names for rich preview
-    album_names = []
-    for row in rows:
-        if row < len(self.albums):
-            album_names.append(f"{self.albums[row].artist} - {self.albums[row].name}")
+    albums = self.albums
+    album_names = [f"{albums[row].artist} - {albums[row].name}"
+                   for row in rows if row < len(albums)]
     
     if album_names:
         mime_data.setData("application/x-album-names", QByteArray("\n".join(album_names).encode()))
@@ -145,18 +232,8 @@ def start_drag(self, supportedActions):
         drag_pixmap = self.create_drag_preview(album_names)
     else:
         # Fallback to a simple colored rectangle
-        log.debug("Creating simple drag preview (no album names)")
-        drag_pixmap = QPixmap(300, 70)
-        drag_pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(drag_pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QBrush(QColor(40, 40, 40, 230)))
-        painter.setPen(QPen(QColor(29, 185, 84), 2))
-        painter.drawRoundedRect(0, 0, 300, 70, 10, 10)
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        painter.drawText(drag_pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "Moving selection...")
-        painter.end()
+        log.debug("Using simple drag preview (no album names)")
+        drag_pixmap = _simple_drag_preview()
     
     # Create and execute the drag
     drag = QDrag(self)
@@ -194,8 +271,7 @@ def create_drag_preview(self, album_names):
     more_count = len(album_names) - max_items if len(album_names) > max_items else 0
     
     # Calculate size
-    font = QFont("Segoe UI", 10)
-    bold_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+    font = _PREVIEW_FONT
     metrics = QFontMetrics(font)
     
     # Calculate maximum width needed
@@ -235,24 +311,18 @@ def create_drag_preview(self, album_names):
     
     # Draw album icon on the left
     icon_size = 24
+    note_pixmap = _glyph_pixmap("♪", _PREVIEW_NOTE_COLOR, icon_size)
+    
+    # Drawing the icons doesn't touch the pen or font, so set them once
+    painter.setPen(_PREVIEW_NAME_COLOR)
+    painter.setFont(font)
     for i, name in enumerate(display_names):
         y_pos = 20 + (i * row_height)
         
-        # Draw album icon placeholder
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(QColor(60, 60, 60)))
-        painter.drawEllipse(15, y_pos, icon_size, icon_size)
-        
-        # Draw note symbol
-        painter.setPen(QPen(QColor(200, 200, 200)))
-        painter.setFont(QFont("Segoe UI", 10))
-        painter.drawText(QRect(15, y_pos, icon_size, icon_size), 
-                         Qt.AlignmentFlag.AlignCenter, "♪")
+        # Draw album icon placeholder with a note symbol
+        painter.drawPixmap(15, y_pos, note_pixmap)
         
         # Draw album name
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        painter.setFont(font)
-        
         # Elide text if too long
         text_rect = QRect(50, y_pos, max_width - 60, row_height)
         elided_text = metrics.elidedText(name, Qt.TextElideMode.ElideRight, text_rect.width())
@@ -262,7 +332,7 @@ def create_drag_preview(self, album_names):
     if more_count > 0:
         y_pos = 20 + (len(display_names) * row_height)
         painter.setPen(QPen(QColor(180, 180, 180)))
-        painter.setFont(QFont("Segoe UI", 9, QFont.Weight.Normal))
+        painter.setFont(_PREVIEW_SMALL_FONT)
         painter.drawText(QRect(50, y_pos, max_width - 60, row_height), 
                          Qt.AlignmentFlag.AlignVCenter, f"and {more_count} more...")
     
@@ -309,8 +379,11 @@ def enhanced_drop_mime_data(self, data, action, row, column, parent):
         log.debug("Invalid drop target (same position), rejecting")
         return False
     
-    # Emit signals for custom animation
-    self.beginResetModel()
+    # Move just the dragged row instead of resetting the whole model
+    if not self.beginMoveRows(QModelIndex(), source_row, source_row,
+                              QModelIndex(), target_row):
+        log.debug("Model rejected row move, rejecting drop")
+        return False
     
     # Store the source and target for anyone who wants to animate
     self.last_drag_source = source_row
@@ -324,28 +397,12 @@ def enhanced_drop_mime_data(self, data, action, row, column, parent):
         target_row -= 1
     
     self.albums.insert(target_row, album)
-    self.endResetModel()
+    self.endMoveRows()
     
-    # Notify view of the change
-    min_row = min(source_row, target_row)
-    max_row = max(source_row, target_row)
-    log.debug(f"Emitting dataChanged for rows {min_row} to {max_row}")
-    self.dataChanged.emit(self.index(min_row, 0),
-                         self.index(max_row, self.columnCount() - 1))
+    # Notify listeners about the moved row; the move itself already updated the view
+    log.debug(f"Emitting dataChanged for moved row {target_row}")
+    self.dataChanged.emit(self.index(target_row, 0),
+                         self.index(target_row, self.columnCount() - 1))
     
     return True
 
-
-def paint_with_drag_handle(self, painter, option, index, original_paint):
-    """
-    Paint method with added drag handle indicators.
-    
-    Args:
-        self: The delegate instance
-        painter: The QPainter to use
-        option: The style option
-        index: The model index being painted
-        original_paint: The original paint method to call (not self.original_paint)
-    """
-    # Call the original paint method directly (not through self)
-    original_paint(painter, option, index)
\ No newline at end of file
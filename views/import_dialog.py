@@ -4,6 +4,7 @@ views/import_dialog.py
 Import dialog for album lists
 """
 
+import functools
 import os
 import traceback
 from typing import List, Optional, Tuple
@@ -23,6 +24,23 @@ from utils.logging_utils import get_module_logger
 log = get_module_logger()
 
 
+@functools.lru_cache(maxsize=None)
+def _bold_font(point_size: int) -> QFont:
+    """
+    Get a shared bold dialog font.
+    
+    This module is imported before the QApplication exists, so fonts are
+    created on first use and then reused by every dialog.
+    
+    Args:
+        point_size: The font size in points
+        
+    Returns:
+        QFont: The bold font
+    """
+    return QFont("Segoe UI", point_size, QFont.Weight.Bold)
+
+
 class ImportDialog(QDialog):
     """Dialog for importing album lists from various formats."""
     
@@ -34,8 +52,8 @@ class ImportDialog(QDialog):
         self.setWindowTitle("Import Album List")
         self.setMinimumSize(600, 400)
         
-        # List manager for handling the import
-        self.list_manager = AlbumListManager()
+        # List manager for handling the import, reusing the parent window's
+        self.list_manager = getattr(parent, 'list_manager', None) or AlbumListManager()
         
         # Variables to store the import results
         self.imported_albums = []
@@ -53,7 +71,7 @@ class ImportDialog(QDialog):
         
         # Welcome message
         welcome_label = QLabel("Import Album List")
-        welcome_label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        welcome_label.setFont(_bold_font(14))
         main_layout.addWidget(welcome_label)
         
         description_label = QLabel(
@@ -84,7 +102,7 @@ class ImportDialog(QDialog):
         
         # Preview section
         preview_label = QLabel("Preview:")
-        preview_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        preview_label.setFont(_bold_font(11))
         main_layout.addWidget(preview_label)
         
         self.preview_list = QListWidget()
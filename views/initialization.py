@@ -67,8 +67,10 @@ def initialize_repository(config: Config) -> SimpleCollectionManager:  # Updated
             log.warning("No QApplication instance, skipping migration dialog")
         
         # Mark as initialized
-        config.set("repository/initialized", True)
-        config.set("repository/path", collection_manager.app_dir)  # Updated path
+        config.set_many({
+            "repository/initialized": True,
+            "repository/path": collection_manager.app_dir  # Updated path
+        })
         log.info(f"Collection manager initialized at: {collection_manager.app_dir}")
     else:
         log.debug("Collection manager already initialized")
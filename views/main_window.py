@@ -3,22 +3,24 @@ Main window view for the SuShe NG application with Spotify-like design.
 """
 import os
 import base64
+import functools
 from datetime import datetime
 from typing import Optional
 import traceback
 
 from PyQt6.QtGui import (QAction, QIcon, QCloseEvent, QPixmap, QColor,
-                    QPainter, QPen, QPainterPath, QFont, QImage)
+                    QPainter, QPen, QPainterPath, QFont, QKeySequence,
+                    QPixmapCache, QImageReader)
 from PyQt6.QtWidgets import (QMainWindow, QTableView, QStatusBar,
                            QVBoxLayout, QHBoxLayout, QWidget, QLabel, QFileDialog,
                            QPushButton, QLineEdit, QFrame, QHeaderView, QMessageBox,
-                            QStyledItemDelegate, QStyle)
-from PyQt6.QtCore import (Qt, QEvent, QRect, QRectF)
+                            QStyledItemDelegate, QStyle, QApplication)
+from PyQt6.QtCore import (Qt, QEvent, QRect, QRectF, QBuffer, QByteArray)
 
 from views.import_dialog import show_import_dialog
 from utils.album_list_manager import AlbumListManager
 from utils.simple_collection_manager import SimpleCollectionManager  # New import
-from models.album_table_model import AlbumTableModel
+from models.album_table_model import AlbumTableModel, Column
 from utils.theme import SpotifyTheme
 from utils.config import Config
 from resources import get_resource_path, resource_exists
@@ -28,15 +30,200 @@ from utils.logging_utils import get_module_logger
 # Get module logger
 log = get_module_logger()
 
+# Album table stylesheet, applied once when the table is created
+_ALBUM_TABLE_STYLESHEET = """
+    QTableView {
+        background-color: #121212;
+        alternate-background-color: #181818;
+        color: #FFFFFF;
+        border: none;
+        selection-background-color: #333333;
+        selection-color: #FFFFFF;
+        outline: none; /* Remove focus outline */
+    }
+    QTableView::item {
+        padding: 8px;
+        border-bottom: 1px solid #282828;
+    }
+    QTableView::item:selected {
+        background-color: #333333;
+    }
+    /* Style for drop indicator */
+    QTableView::drop-indicator {
+        background-color: #1DB954;
+        border-radius: 2px;
+        height: 4px;
+        width: 100%;
+    }
+"""
+
+# Album table header stylesheet
+_TABLE_HEADER_STYLESHEET = """
+    QHeaderView::section {
+        background-color: #121212;
+        color: #B3B3B3;
+        padding: 8px;
+        border: none;
+        border-bottom: 1px solid #333333;
+        font-weight: bold;
+    }
+"""
+
+# Header search box stylesheet
+_SEARCH_BOX_STYLESHEET = """
+    QLineEdit {
+        background-color: #FFFFFF;
+        border-radius: 16px;
+        padding: 8px 12px;
+        color: #121212;
+    }
+"""
+
+# Album section title stylesheet
+_TITLE_LABEL_STYLESHEET = "font-size: 24px; font-weight: bold; color: #FFFFFF;"
+
+# Stylesheet for the main window and the Spotify-like components in it
+_MAIN_WINDOW_STYLESHEET = """
+    QMainWindow {
+        background-color: #121212;
+    }
+    #mainHeader {
+        background-color: rgba(0, 0, 0, 0.5);
+        border-bottom: 1px solid #333333;
+    }
+    QPushButton#navButton {
+        background-color: rgba(0, 0, 0, 0.7);
+        color: #FFFFFF;
+        border-radius: 16px;
+        font-weight: bold;
+    }
+    QPushButton#navButton:hover {
+        background-color: rgba(255, 255, 255, 0.1);
+    }
+    QTableView {
+        background-color: #121212;
+        alternate-background-color: #181818;
+        color: #FFFFFF;
+        border: none;
+        selection-background-color: #333333;
+        selection-color: #FFFFFF;
+    }
+    QTableView::item {
+        padding: 8px;
+        border-bottom: 1px solid #282828;
+    }
+    QTableView::item:selected {
+        background-color: #333333;
+    }
+    QScrollBar:vertical {
+        background-color: #121212;
+        width: 12px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #535353;
+        border-radius: 6px;
+        min-height: 30px;
+        margin: 3px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar:horizontal {
+        background-color: #121212;
+        height: 12px;
+        margin: 0px;
+    }
+    QScrollBar::handle:horizontal {
+        background-color: #535353;
+        border-radius: 6px;
+        min-width: 30px;
+        margin: 3px;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+    QStatusBar {
+        background-color: #181818;
+        color: #B3B3B3;
+    }
+    QMenuBar {
+        background-color: #121212;
+        color: #FFFFFF;
+    }
+    QMenuBar::item:selected {
+        background-color: #333333;
+    }
+    QMenu {
+        background-color: #282828;
+        color: #FFFFFF;
+        border: 1px solid #121212;
+    }
+    QMenu::item:selected {
+        background-color: #333333;
+    }
+"""
+
+# Window icon, resolved once and shared by all windows
+_APP_ICON: Optional[QIcon] = None
+
+
+def _get_app_icon() -> Optional[QIcon]:
+    """
+    Get the application window icon, loading it on first use.
+    
+    Prefers the icon main.py already set on the application, which comes
+    from the platform's multi-size icon file, so the 1024px PNG is not
+    decoded a second time just for the main window.
+    
+    Returns:
+        The window icon, or None if the icon resource is missing
+    """
+    global _APP_ICON
+    if _APP_ICON is None:
+        app = QApplication.instance()
+        if app is not None and not app.windowIcon().isNull():
+            log.debug("Using application icon for window")
+            _APP_ICON = app.windowIcon()
+    if _APP_ICON is None and resource_exists(ICON_PATH):
+        log.debug(f"Loading window icon from {ICON_PATH}")
+        _APP_ICON = QIcon(get_resource_path(ICON_PATH))
+    return _APP_ICON
+
 
 class AlbumTableDelegate(QStyledItemDelegate):
     """Custom delegate for album table to add Spotify-like styling with album artwork."""
     
+    # Row colors, shared by every paint call instead of allocated per cell
+    _SELECTED_COLOR = QColor(66, 66, 66)
+    _EVEN_ROW_COLOR = QColor(24, 24, 24)
+    _ODD_ROW_COLOR = QColor(18, 18, 18)
+    _TEXT_COLOR = QColor(255, 255, 255)  # White text
+    
     def __init__(self, parent=None):
         """Initialize the delegate."""
         super().__init__(parent)
-        # Cache for placeholder images to avoid recreating them
-        self.placeholder_cache = {}
+        # Fonts are built once per delegate rather than for every painted cell
+        self.name_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        self.artist_font = QFont("Segoe UI", 10, QFont.Weight.Medium)
+        self.detail_font = QFont("Segoe UI", 9)
+        
+        # Font for each plain text column; the text itself comes from
+        # AlbumTableModel.DISPLAY_GETTERS
+        self.column_fonts = {
+            Column.ARTIST: self.artist_font,
+            Column.RELEASE_DATE: self.detail_font,
+            Column.GENRE1: self.detail_font,
+            Column.GENRE2: self.detail_font,
+            Column.COMMENT: self.detail_font,
+        }
+        
+        # Elided cell text by (text, width, font), see _elide
+        self._elided_text = {}
+        
+        # Scaled covers of the loaded list by (base64 data, size). Cleared
+        # whenever the model is reset, so closed lists are not kept alive.
+        self._cover_pixmaps = {}
         log.debug("AlbumTableDelegate initialized")
     
     def paint(self, painter, option, index):
@@ -51,22 +238,21 @@ class AlbumTableDelegate(QStyledItemDelegate):
         
         # If the item is selected, use Spotify's selection style
         if opt.state & QStyle.StateFlag.State_Selected:
-            painter.fillRect(opt.rect, QColor(66, 66, 66))
-            text_color = Qt.GlobalColor.white
+            painter.fillRect(opt.rect, self._SELECTED_COLOR)
         else:
             # Alternate row colors
             if row % 2 == 0:
-                painter.fillRect(opt.rect, QColor(24, 24, 24))
+                painter.fillRect(opt.rect, self._EVEN_ROW_COLOR)
             else:
-                painter.fillRect(opt.rect, QColor(18, 18, 18))
-            text_color = QColor(255, 255, 255)  # White text
+                painter.fillRect(opt.rect, self._ODD_ROW_COLOR)
+        text_color = self._TEXT_COLOR
         
         # Get the album
         if hasattr(model, 'albums') and row < len(model.albums):
             album = model.albums[row]
             
             # Handle first column with album artwork and name
-            if col == 0:
+            if col == Column.ALBUM:
                 # Draw album artwork
                 image_size = 48  # Size of the album image
                 image_rect = QRect(opt.rect.left() + 12, opt.rect.top() + 4, 
@@ -75,86 +261,79 @@ class AlbumTableDelegate(QStyledItemDelegate):
                 # Get pixmap from base64 data if available
                 pixmap = None
                 if hasattr(album, 'cover_image_data') and album.cover_image_data:
-                    try:
-                        # Convert base64 to image
-                        image_data = base64.b64decode(album.cover_image_data)
-                        qimage = QImage()
-                        qimage.loadFromData(image_data)
-                        pixmap = QPixmap.fromImage(qimage)
-                    except Exception as e:
-                        log.warning(f"Error loading image from base64: {e}")
-                        pixmap = self._get_placeholder_image(image_size)
+                    # Decoded and scaled once per cover, not on every paint
+                    pixmap = self._get_cover_pixmap(album.cover_image_data, image_size)
                 elif hasattr(album, 'cover_image') and album.cover_image:
                     # Fallback to file path (for backward compatibility)
-                    pixmap = QPixmap(album.cover_image)
-                    if pixmap.isNull():
-                        pixmap = self._get_placeholder_image(image_size)
+                    pixmap = _cover_file_pixmap(album.cover_image, image_size)
                 else:
                     # Create a placeholder image
                     pixmap = self._get_placeholder_image(image_size)
                 
-                # Scale the image while keeping aspect ratio
-                pixmap = pixmap.scaled(image_size, image_size, 
-                                    Qt.AspectRatioMode.KeepAspectRatio, 
-                                    Qt.TransformationMode.SmoothTransformation)
-                
-                # Draw the image with a subtle shadow effect
-                painter.save()
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.setBrush(QColor(0, 0, 0, 40))
-                shadow_rect = image_rect.adjusted(2, 2, 2, 2)
-                painter.drawRoundedRect(shadow_rect, 4, 4)
-                painter.restore()
-                
-                # Create a path with rounded corners for the image
-                painter.save()
-                path = QPainterPath()
-                # Convert QRect to QRectF for addRoundedRect
-                path.addRoundedRect(QRectF(image_rect), 4, 4)
-                painter.setClipPath(path)
-                painter.drawPixmap(image_rect, pixmap)
-                painter.restore()
+                # Draw the image with its shadow and rounded corners, both
+                # rendered once per cover rather than clipped on every paint
+                dpr = painter.device().devicePixelRatioF()
+                painter.drawPixmap(image_rect.topLeft(), _framed_cover(pixmap, image_size, dpr))
                 
                 # Draw album name
                 text_rect = QRect(opt.rect)
                 text_rect.setLeft(image_rect.right() + 16)  # Add margin after image
                 
                 painter.setPen(text_color)
-                painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-                elidedText = painter.fontMetrics().elidedText(
-                    album.name, Qt.TextElideMode.ElideRight, text_rect.width() - 20)
+                painter.setFont(self.name_font)
+                elidedText = self._elide(painter, self.name_font, album.name,
+                                         text_rect.width() - 20)
                 painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter, elidedText)
                 
             else:
                 # Draw text for other columns
-                text = ""
-                if col == 1:
-                    text = album.artist
-                    font = QFont("Segoe UI", 10, QFont.Weight.Medium)
-                elif col == 2:
-                    text = album.release_date.strftime("%Y-%m-%d")
-                    font = QFont("Segoe UI", 9)
-                elif col == 3:
-                    text = album.genre1
-                    font = QFont("Segoe UI", 9)
-                elif col == 4:
-                    text = album.genre2
-                    font = QFont("Segoe UI", 9)
-                elif col == 5:
-                    text = album.comment
-                    font = QFont("Segoe UI", 9)
+                font = self.column_fonts[col]
+                text = AlbumTableModel.DISPLAY_GETTERS[col](album)
+                
+                # Empty cells (often genre 2 or comment) need only the background
+                if not text:
+                    return
                 
                 painter.setPen(text_color)
                 painter.setFont(font)
                 # Elide text if it's too long
-                elidedText = painter.fontMetrics().elidedText(
-                    text, Qt.TextElideMode.ElideRight, opt.rect.width() - 16)
+                elidedText = self._elide(painter, font, text, opt.rect.width() - 16)
                 painter.drawText(opt.rect.adjusted(8, 0, -8, 0), 
                             Qt.AlignmentFlag.AlignVCenter, elidedText)
         else:
             # Fallback to default rendering
             super().paint(painter, opt, index)
     
+    def _elide(self, painter, font, text, width):
+        """
+        Elide text to fit a width, reusing earlier results.
+        
+        Cells are repainted with the same text and column width on every
+        scroll and hover, so the font metrics work is done once per
+        combination and screen instead of on every paint.
+        
+        Args:
+            painter: The QPainter, with font already set
+            font: The delegate font the text is drawn with
+            text: The text to elide
+            width: The available width in pixels
+            
+        Returns:
+            The elided text
+        """
+        # Font metrics change with the screen's DPI and scale factor, so
+        # results from a window on another monitor are kept apart
+        device = painter.device()
+        key = (text, width, id(font), device.logicalDpiX(), device.devicePixelRatioF())
+        elided = self._elided_text.get(key)
+        if elided is None:
+            # Keep the cache bounded; column resizes produce new widths
+            if len(self._elided_text) >= 4096:
+                self._elided_text.clear()
+            elided = painter.fontMetrics().elidedText(text, Qt.TextElideMode.ElideRight, width)
+            self._elided_text[key] = elided
+        return elided
+    
     def sizeHint(self, option, index):
         """Return a size hint that accommodates the album artwork."""
         size = super().sizeHint(option, index)
@@ -162,9 +341,32 @@ class AlbumTableDelegate(QStyledItemDelegate):
         size.setHeight(56)
         return size
     
+    def _get_cover_pixmap(self, cover_image_data, size):
+        """
+        Get the scaled cover for base64 image data, decoding it only once.
+        
+        Args:
+            cover_image_data: Base64 encoded image data
+            size: The size to scale the cover to
+            
+        Returns:
+            QPixmap: The scaled cover, or the placeholder if decoding failed
+        """
+        key = (cover_image_data, size)
+        pixmap = self._cover_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = _cover_pixmap(cover_image_data, size)
+            self._cover_pixmaps[key] = pixmap
+        return pixmap
+    
+    def clear_cover_cache(self):
+        """Drop the decoded covers, e.g. when a different list is loaded."""
+        log.debug(f"Clearing {len(self._cover_pixmaps)} cached covers")
+        self._cover_pixmaps.clear()
+    
     def _get_placeholder_image(self, size):
         """
-        Create a placeholder image for albums without covers.
+        Get the placeholder image for albums without covers.
         
         Args:
             size: The size of the placeholder image
@@ -172,29 +374,203 @@ class AlbumTableDelegate(QStyledItemDelegate):
         Returns:
             QPixmap: The placeholder image
         """
-        # Check cache first
-        if size in self.placeholder_cache:
-            return self.placeholder_cache[size]
+        return _placeholder_pixmap(size)
+
+
+@functools.lru_cache(maxsize=8)
+def _placeholder_pixmap(size: int) -> QPixmap:
+    """
+    Render the placeholder image for albums without covers.
+    
+    The result depends only on the size, so it is cached and shared by
+    every delegate instead of being rebuilt per delegate.
+    
+    Args:
+        size: The size of the placeholder image
         
-        # Create a new placeholder
-        pixmap = QPixmap(size, size)
-        pixmap.fill(QColor(40, 40, 40))  # Dark gray background
+    Returns:
+        QPixmap: The placeholder image
+    """
+    pixmap = QPixmap(size, size)
+    pixmap.fill(QColor(40, 40, 40))  # Dark gray background
+    
+    # Draw a music note icon in the center
+    painter = QPainter(pixmap)
+    painter.setPen(QPen(QColor(180, 180, 180), 1))  # Light gray for the icon
+    painter.setFont(QFont("Segoe UI", size // 4))
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "♪")
+    painter.end()
+    
+    return pixmap
+
+
+def _cover_pixmap(cover_image_data: str, size: int) -> QPixmap:
+    """
+    Decode a base64 album cover and scale it for the album table.
+    
+    Decoding and smooth-scaling a full size cover is by far the most
+    expensive part of painting a row, and rows are repainted on every
+    scroll and hover, so the delegate caches the result for the loaded
+    list (see AlbumTableDelegate._get_cover_pixmap).
+    
+    Args:
+        cover_image_data: Base64 encoded image data
+        size: The size to scale the cover to, keeping its aspect ratio
         
-        # Draw a music note icon in the center
-        painter = QPainter(pixmap)
-        painter.setPen(QPen(QColor(180, 180, 180), 1))  # Light gray for the icon
-        painter.setFont(QFont("Segoe UI", size // 4))
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "♪")
-        painter.end()
+    Returns:
+        QPixmap: The scaled cover, or the placeholder if decoding failed
+    """
+    try:
+        image_data = base64.b64decode(cover_image_data)
+    except Exception as e:
+        log.warning(f"Error loading image from base64: {e}")
+        return _placeholder_pixmap(size)
+    
+    buffer = QBuffer()
+    buffer.setData(QByteArray(image_data))
+    reader = QImageReader(buffer)
+    
+    # Decode straight at the target size, keeping aspect ratio, rather
+    # than decoding the full size cover and scaling it down afterwards
+    source_size = reader.size()
+    scaled_on_read = source_size.isValid()
+    if scaled_on_read:
+        reader.setScaledSize(source_size.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio))
+    
+    image = reader.read()
+    if image.isNull():
+        log.warning(f"Error decoding cover image: {reader.errorString()}")
+        return _placeholder_pixmap(size)
+    
+    # Formats that can't report their size up front are decoded at full
+    # size, so scale those down before they are cached
+    if not scaled_on_read:
+        image = image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    
+    return QPixmap.fromImage(image)
+
+
+def _cover_file_pixmap(cover_image: str, size: int) -> QPixmap:
+    """
+    Load an album cover from an image file and scale it for the album table.
+    
+    Results go through the global QPixmapCache, keyed by path and size,
+    so the file is not read from disk on every paint. Unlike the base64
+    covers these are only used by old lists, so they share Qt's own
+    byte-bounded cache rather than holding a dedicated one.
+    
+    Args:
+        cover_image: Path to the cover image file
+        size: The size to scale the cover to, keeping its aspect ratio
         
-        # Cache the placeholder
-        self.placeholder_cache[size] = pixmap
+    Returns:
+        QPixmap: The scaled cover, or the placeholder if the file can't be loaded
+    """
+    key = f"sushe-cover:{size}:{cover_image}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
         return pixmap
+    
+    pixmap = QPixmap(cover_image)
+    if pixmap.isNull():
+        return _placeholder_pixmap(size)
+    
+    # Scale the image while keeping aspect ratio
+    pixmap = pixmap.scaled(size, size,
+                           Qt.AspectRatioMode.KeepAspectRatio,
+                           Qt.TransformationMode.SmoothTransformation)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# Covers with shadow and rounded corners applied,
+# by (pixmap cache key, size, device pixel ratio)
+_framed_covers = {}
+
+
+def _framed_cover(pixmap: QPixmap, size: int, dpr: float) -> QPixmap:
+    """
+    Render a cover with the table's subtle shadow and rounded corners.
+    
+    Clipping to a rounded path is one of the more expensive painter
+    operations, so each cover is framed once and then blitted as is.
+    
+    Args:
+        pixmap: The scaled cover, from one of the cover caches
+        size: The size the cover is drawn at
+        dpr: Device pixel ratio of the screen, so the frame is rendered at
+            native resolution instead of being upscaled on HiDPI screens
+        
+    Returns:
+        QPixmap: The framed cover, 2px larger than size for the shadow
+    """
+    key = (pixmap.cacheKey(), size, dpr)
+    framed = _framed_covers.get(key)
+    if framed is not None:
+        return framed
+    
+    # Keep the cache bounded; covers of closed lists age out this way
+    if len(_framed_covers) >= 512:
+        _framed_covers.clear()
+    
+    framed_size = round((size + 2) * dpr)
+    framed = QPixmap(framed_size, framed_size)
+    framed.setDevicePixelRatio(dpr)
+    framed.fill(Qt.GlobalColor.transparent)
+    image_rect = QRect(0, 0, size, size)
+    
+    painter = QPainter(framed)
+    
+    # Subtle shadow effect
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(0, 0, 0, 40))
+    painter.drawRoundedRect(image_rect.adjusted(2, 2, 2, 2), 4, 4)
+    
+    # Image clipped to a path with rounded corners
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(image_rect), 4, 4)
+    painter.setClipPath(path)
+    painter.drawPixmap(image_rect, pixmap)
+    painter.end()
+    
+    _framed_covers[key] = framed
+    return framed
 
 
 class MainWindow(QMainWindow):
     """Main application window with Spotify-like design."""
     
+    # Marker for the position of the Recent Files submenu in the File menu
+    _RECENT_FILES_ENTRY = "recent_files"
+    
+    # Initial album table column widths; None stretches the column
+    _COLUMN_WIDTHS = (
+        (Column.ALBUM, 300),         # Album name + cover
+        (Column.ARTIST, 180),        # Artist
+        (Column.RELEASE_DATE, 120),
+        (Column.GENRE1, 140),
+        (Column.GENRE2, 140),
+        (Column.COMMENT, None),
+    )
+    
+    # File menu layout as (text, shortcut, handler method name);
+    # None inserts a separator. Save As and Exit keep explicit shortcuts
+    # because their standard keys have no binding on Windows.
+    _FILE_MENU_ACTIONS = (
+        ("&New", QKeySequence.StandardKey.New, "_new_file"),
+        ("&Open", QKeySequence.StandardKey.Open, "_open_file"),
+        ("&Save", QKeySequence.StandardKey.Save, "_save_file"),
+        ("Save &As", "Ctrl+Shift+S", "_save_file_as"),
+        None,
+        ("&Import List...", "Ctrl+I", "_import_list"),
+        ("&Export List...", "Ctrl+E", "_export_list"),
+        None,
+        _RECENT_FILES_ENTRY,
+        None,
+        ("E&xit", "Ctrl+Q", "close"),
+    )
+    
     def __init__(self, config: Optional[Config] = None, collection_manager: Optional[SimpleCollectionManager] = None):
         """
         Initialize the main window.
@@ -216,14 +592,18 @@ class MainWindow(QMainWindow):
             self.collection_manager = collection_manager or SimpleCollectionManager()
             log.debug("Collection manager stored")
             
+            # List manager shared by every import and export of this window
+            self.list_manager = AlbumListManager()
+            
             self.setWindowTitle("SuShe NG")
             self.setMinimumSize(1000, 700)
             log.debug("Window title and size set")
             
             # Set window icon if available
-            if resource_exists(ICON_PATH):
-                log.debug(f"Setting window icon from {ICON_PATH}")
-                self.setWindowIcon(QIcon(get_resource_path(ICON_PATH)))
+            icon = _get_app_icon()
+            if icon is not None:
+                log.debug("Setting window icon")
+                self.setWindowIcon(icon)
             else:
                 log.warning("No icon found for window")
             
@@ -307,8 +687,7 @@ class MainWindow(QMainWindow):
                     return
             
             # Get collections from manager
-            collections = self.collection_manager.get_collections()
-            collection_names = list(collections.keys())
+            collection_names = self.collection_manager.get_collection_names()
             log.debug(f"Available collections: {collection_names}")
             
             # Import the new list dialog
@@ -330,12 +709,7 @@ class MainWindow(QMainWindow):
             
             # Create a new empty list
             log.debug("Creating new empty album list")
-            self.albums = []
-            self.model = AlbumTableModel(self.albums)
-            self.table_view.setModel(self.model)
-            
-            # Set up the table again to ensure proper display
-            self.setup_enhanced_drag_drop()
+            self._show_albums([])
             
             # Reset current file path
             self.current_file_path = None
@@ -381,31 +755,13 @@ class MainWindow(QMainWindow):
                 log.debug("User cancelled file selection")
                 return
                     
-            # Get collections
-            collections = self.collection_manager.get_collections()
-            collection_names = list(collections.keys())
-            
-            # Import the collection selection dialog
-            from views.collection_selection_dialog import select_collection
-            
-            # Show the collection selection dialog
-            log.debug("Showing collection selection dialog")
-            collection_name, is_new, ok = select_collection(
-                collection_names,
-                self,
+            # Ask which collection to import into
+            collection_name = self._choose_collection(
                 "Import Album List",
                 "Choose a collection for the imported list:"
             )
-            
-            if not ok:
-                # User canceled
-                log.debug("User cancelled collection selection")
+            if not collection_name:
                 return
-            
-            # Create the new collection if needed
-            if is_new:
-                log.info(f"Creating new collection for import: {collection_name}")
-                self.collection_manager.create_collection(collection_name)
                 
             # Import the file
             log.info(f"Importing file: {file_path}")
@@ -462,12 +818,9 @@ class MainWindow(QMainWindow):
                 log.debug("User cancelled export dialog")
                 return
             
-            # Create a list manager
-            list_manager = AlbumListManager()
-            
             # Export the list
             log.info(f"Exporting {len(self.albums)} albums to {file_path}")
-            list_manager.export_to_new_format(
+            self.list_manager.export_to_new_format(
                 self.albums,
                 self.list_metadata,
                 file_path
@@ -480,7 +833,6 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'config') and self.config:
                 log.debug("Adding exported file to recent files")
                 self.config.add_recent_file(file_path)
-                self._update_recent_files_menu()
             
         except Exception as e:
             # Show error message
@@ -524,15 +876,8 @@ class MainWindow(QMainWindow):
             # Load the list from the collection manager
             albums, metadata = self.collection_manager.load_album_list(file_path)
             
-            # Set the albums
-            self.albums = albums
-            
-            # Create a new model with the loaded albums
-            self.model = AlbumTableModel(self.albums)
-            self.table_view.setModel(self.model)
-            
-            # Set up the table again to ensure proper display
-            self.setup_enhanced_drag_drop()
+            # Show the loaded albums
+            self._show_albums(albums)
             
             # Store the metadata
             self.list_metadata = metadata
@@ -567,6 +912,20 @@ class MainWindow(QMainWindow):
                 f"An error occurred while opening the file: {str(e)}"
             )
 
+    def _show_albums(self, albums):
+        """
+        Replace the albums shown in the table.
+        
+        The existing model is reset with the new albums rather than
+        replaced, so the view keeps its selection model, column setup and
+        drag and drop patches, and repaints once for the whole list.
+        
+        Args:
+            albums: List of Album objects to show
+        """
+        self.albums = albums
+        self.model.set_albums(self.albums)
+
     def save_to_collection_manager(self, existing_path=None, allow_empty=False):
         """
         Save the current album list to the collection manager.
@@ -599,28 +958,14 @@ class MainWindow(QMainWindow):
             
             if not collection_name:
                 log.debug("No collection specified, prompting user")
-                # Get collections
-                collections = self.collection_manager.get_collections()
-                collection_names = list(collections.keys())
-                
                 # Ask which collection to save to
-                from views.collection_selection_dialog import select_collection
-                collection_name, is_new, ok = select_collection(
-                    collection_names,
-                    self,
+                collection_name = self._choose_collection(
                     "Save Album List",
                     "Choose a collection for your album list:"
                 )
-                
-                if not ok:
-                    log.debug("User cancelled collection selection")
+                if not collection_name:
                     return
                 
-                # Create new collection if needed
-                if is_new:
-                    log.info(f"Creating new collection: {collection_name}")
-                    self.collection_manager.create_collection(collection_name)
-                
                 # Update metadata with collection
                 self.list_metadata["collection"] = collection_name
             
@@ -655,8 +1000,6 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'config') and self.config:
                 log.debug("Adding saved file to recent files")
                 self.config.add_recent_file(file_path)
-                # Update the recent files menu
-                self._update_recent_files_menu()
                 
         except Exception as e:
             log.error(f"Error saving to collection manager: {e}")
@@ -708,47 +1051,69 @@ class MainWindow(QMainWindow):
                 "title": "My Album List"
             }
         
-        # Get collections
-        collections = self.collection_manager.get_collections()
-        collection_names = list(collections.keys())
-        
         # Ask which collection to save to
+        collection_name = self._choose_collection(
+            "Save Album List",
+            "Choose a collection for your album list:"
+        )
+        if not collection_name:
+            return
+        
+        # Update metadata with collection
+        self.list_metadata["collection"] = collection_name
+        
+        # Save to collection manager
+        log.debug(f"Saving to collection: {collection_name}")
+        self.save_to_collection_manager()
+
+    def _choose_collection(self, title: str, prompt: str) -> Optional[str]:
+        """
+        Ask the user for a collection, creating it if they entered a new one.
+        
+        Args:
+            title: Title of the collection selection dialog
+            prompt: Prompt text shown in the dialog
+            
+        Returns:
+            The chosen collection name, or None if the user cancelled or
+            confirmed without choosing a collection
+        """
+        # Only the collection names are needed, not the lists inside them
+        collection_names = self.collection_manager.get_collection_names()
+        
         from views.collection_selection_dialog import select_collection
+        log.debug("Showing collection selection dialog")
         collection_name, is_new, ok = select_collection(
             collection_names,
             self,
-            "Save Album List",
-            "Choose a collection for your album list:"
+            title,
+            prompt
         )
         
-        if not ok:
-            log.debug("User cancelled save dialog")
-            return
+        if not ok or not collection_name:
+            log.debug("No collection selected")
+            return None
         
         # Create new collection if needed
         if is_new:
             log.info(f"Creating new collection: {collection_name}")
             self.collection_manager.create_collection(collection_name)
         
-        # Update metadata with collection
-        self.list_metadata["collection"] = collection_name
-        
-        # Save to collection manager
-        log.debug(f"Saving to collection: {collection_name}")
-        self.save_to_collection_manager()
+        return collection_name
 
     def _update_recent_files_menu(self):
         """
         Update the recent files menu.
+        
+        Connected to the menu's aboutToShow signal, so the list files are
+        only read when the user actually opens the menu rather than at
+        startup and after every save.
         """
         log.debug("Updating recent files menu")
         if not hasattr(self, 'recent_files_menu'):
             log.warning("Recent files menu not found")
             return
         
-        # Clear the menu
-        self.recent_files_menu.clear()
-        
         # Get recent files from both sources
         recent_files = []
         if hasattr(self, 'config') and self.config:
@@ -756,58 +1121,94 @@ class MainWindow(QMainWindow):
             config_recent = self.config.get_recent_files()
             recent_files.extend(config_recent)
         
+        # Skip the rebuild if no recent path was added, removed or modified
+        # since the menu was last built. Stat calls are much cheaper than
+        # reading every list file again.
+        recent_lists = []
         if hasattr(self, 'collection_manager'):
-            # Get from collection manager
-            manager_recent = [item["file_path"] for item in self.collection_manager.get_recent_lists()]
-            # Add to the list if not already there
-            for path in manager_recent:
-                if path not in recent_files:
-                    recent_files.append(path)
+            recent_lists = self.collection_manager.metadata.get("recent_lists", [])[:5]
+        snapshot_paths = recent_files + recent_lists
         
-        # Remove duplicates and non-existent files
-        recent_files = [f for f in recent_files if os.path.exists(f)]
+        # One stat per path; a file deleted meanwhile just shows as missing.
+        # The results are passed on to the rebuild, so nothing is stat'ed twice.
+        path_stats = {}
+        for path in snapshot_paths:
+            if path not in path_stats:
+                try:
+                    path_stats[path] = os.stat(path)
+                except OSError:
+                    path_stats[path] = None
+        snapshot = tuple(
+            (path, path_stats[path].st_mtime_ns if path_stats[path] else None)
+            for path in snapshot_paths
+        )
+        if snapshot == getattr(self, '_recent_files_snapshot', None):
+            log.debug("Recent files unchanged, keeping menu")
+            return
+        self._recent_files_snapshot = snapshot
+        
+        # Clear the menu
+        self.recent_files_menu.clear()
+        
+        # Ordered set of paths, so duplicate checks don't scan the list
+        recent_files = dict.fromkeys(recent_files)
+        
+        # Add the collection manager's recent lists that can still be read
+        for path in recent_lists:
+            if path_stats[path] is None:
+                log.warning(f"Recent list not found: {path}")
+            elif self.collection_manager.get_list_info(path, path_stats[path]):
+                # Add to the list if not already there
+                recent_files.setdefault(path)
+        
+        # Remove non-existent files, reusing the snapshot's existence checks
+        recent_files = [f for f in recent_files if path_stats[f] is not None]
         # Limit to first 10
         recent_files = recent_files[:10]
         
         if not recent_files:
             # Add a disabled "No recent files" action
             log.debug("No recent files found")
-            action = QAction("No recent files", self)
-            action.setEnabled(False)
-            self.recent_files_menu.addAction(action)
+            self.recent_files_menu.addAction(self._no_recent_files_action)
         else:
             # Add actions for each recent file
             log.debug(f"Adding {len(recent_files)} recent files to menu")
             for file_path in recent_files:
-                # Try to get more descriptive name from collection manager
-                title = os.path.basename(file_path)
-                collection = None
-                
+                # Try to get more descriptive name from collection manager,
+                # which only reads the file if it has changed
+                list_info = None
                 if hasattr(self, 'collection_manager'):
-                    # Try to get info from collection manager
-                    list_info = self.collection_manager._get_list_info(file_path)
-                    if list_info:
-                        title = list_info.get("title", title)
-                        collection = list_info.get("collection")
+                    list_info = self.collection_manager.get_list_info(
+                        file_path, path_stats[file_path])
                 
-                # Create menu item name
-                if collection:
-                    display_name = f"{title} ({collection})"
+                if list_info:
+                    display_name = list_info["display_name"]
                 else:
-                    display_name = title
+                    display_name = os.path.basename(file_path)
                     
-                action = QAction(display_name, self)
+                # Owned by the menu, so the next clear() deletes it.
+                # Opened by _open_recent_file_action through the menu's
+                # triggered signal, so no per-action slot is needed
+                action = self.recent_files_menu.addAction(display_name)
                 action.setData(file_path)
-                action.triggered.connect(lambda checked, path=file_path: self.open_album_list(path))
-                self.recent_files_menu.addAction(action)
             
             # Add separator
             self.recent_files_menu.addSeparator()
             
             # Add "Clear Recent Files" action
-            clear_action = QAction("Clear Recent Files", self)
-            clear_action.triggered.connect(self._clear_recent_files)
-            self.recent_files_menu.addAction(clear_action)
+            self.recent_files_menu.addAction(self._clear_recent_files_action)
+
+    def _open_recent_file_action(self, action: QAction) -> None:
+        """
+        Open the list behind a triggered Recent Files menu action.
+        
+        Args:
+            action: The triggered action; recent file actions carry their
+                file path as data, other actions in the menu carry none
+        """
+        file_path = action.data()
+        if file_path:
+            self.open_album_list(file_path)
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """
@@ -864,7 +1265,6 @@ class MainWindow(QMainWindow):
             self.collection_manager.metadata["recent_lists"] = []
             self.collection_manager._save_metadata()
         
-        self._update_recent_files_menu()
         log.info("Recent files list cleared")
 
     def create_main_panel(self) -> QWidget:
@@ -887,44 +1287,18 @@ class MainWindow(QMainWindow):
             search_box = QLineEdit()
             search_box.setPlaceholderText("Search albums...")
             search_box.setFixedWidth(220)
-            search_box.setStyleSheet("""
-                QLineEdit {
-                    background-color: #FFFFFF;
-                    border-radius: 16px;
-                    padding: 8px 12px;
-                    color: #121212;
-                }
-            """)
+            search_box.setStyleSheet(_SEARCH_BOX_STYLESHEET)
             header_layout.addWidget(search_box)
             
             # Add navigation buttons (placeholders - not functional yet)
+            # Styled by the #navButton rules in the window stylesheet
             nav_back = QPushButton("←")
+            nav_back.setObjectName("navButton")
             nav_back.setFixedSize(32, 32)
-            nav_back.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 0.7);
-                    color: #FFFFFF;
-                    border-radius: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 255, 255, 0.1);
-                }
-            """)
             
             nav_forward = QPushButton("→")
+            nav_forward.setObjectName("navButton")
             nav_forward.setFixedSize(32, 32)
-            nav_forward.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(0, 0, 0, 0.7);
-                    color: #FFFFFF;
-                    border-radius: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 255, 255, 0.1);
-                }
-            """)
             
             header_layout.addWidget(nav_back)
             header_layout.addWidget(nav_forward)
@@ -940,7 +1314,7 @@ class MainWindow(QMainWindow):
             title_bar_layout.setContentsMargins(16, 16, 16, 8)
             
             title_label = QLabel("All Albums")
-            title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #FFFFFF;")
+            title_label.setStyleSheet(_TITLE_LABEL_STYLESHEET)
             title_bar_layout.addWidget(title_label)
             
             layout.addWidget(title_bar)
@@ -960,6 +1334,9 @@ class MainWindow(QMainWindow):
             self.table_view.setFrameShape(QFrame.Shape.NoFrame)
             self.table_view.verticalHeader().setVisible(False)
             self.table_view.verticalHeader().setDefaultSectionSize(56)
+            # Every row has the same height, so never measure rows individually
+            self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            self.table_view.setStyleSheet(_ALBUM_TABLE_STYLESHEET)
             
             # Start with an empty album list
             self.albums = []
@@ -971,48 +1348,30 @@ class MainWindow(QMainWindow):
             
             # Now set properties that require a model to be set first
             log.debug("Creating table delegate")
-            self.table_view.setItemDelegate(AlbumTableDelegate())
+            # One delegate, owned by the view, serves every model loaded into it
+            self.table_delegate = AlbumTableDelegate(self.table_view)
+            self.table_view.setItemDelegate(self.table_delegate)
+            # Loading another list resets the model; drop the old list's covers
+            self.model.modelReset.connect(self.table_delegate.clear_cover_cache)
             
             # Style the headers
             self.table_view.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.table_view.horizontalHeader().setStyleSheet("""
-                QHeaderView::section {
-                    background-color: #121212;
-                    color: #B3B3B3;
-                    padding: 8px;
-                    border: none;
-                    border-bottom: 1px solid #333333;
-                    font-weight: bold;
-                }
-            """)
+            self.table_view.horizontalHeader().setStyleSheet(_TABLE_HEADER_STYLESHEET)
             
             # Set resize modes now that we have a model
             header = self.table_view.horizontalHeader()
             header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
             
-            if self.model.columnCount() > 0:
-                # If we have columns, set their specific resize modes
-                header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)  # Album name + cover
-                self.table_view.setColumnWidth(0, 300)
-                
-                if self.model.columnCount() > 1:
-                    header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)  # Artist
-                    self.table_view.setColumnWidth(1, 180)
-                
-                if self.model.columnCount() > 2:
-                    header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)  # Release date
-                    self.table_view.setColumnWidth(2, 120)
-                
-                if self.model.columnCount() > 3:
-                    header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)  # Genre 1
-                    self.table_view.setColumnWidth(3, 140)
-                
-                if self.model.columnCount() > 4:
-                    header.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)  # Genre 2
-                    self.table_view.setColumnWidth(4, 140)
-                
-                if self.model.columnCount() > 5:
-                    header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)  # Comment
+            # Apply the initial column widths, querying the column count once
+            column_count = self.model.columnCount()
+            for column, width in self._COLUMN_WIDTHS:
+                if column >= column_count:
+                    break
+                if width is None:
+                    header.setSectionResizeMode(column, QHeaderView.ResizeMode.Stretch)
+                else:
+                    header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+                    self.table_view.setColumnWidth(column, width)
             
             # Add the table view to the layout
             layout.addWidget(self.table_view, 1)  # Give it stretch factor
@@ -1044,7 +1403,7 @@ class MainWindow(QMainWindow):
             row_index: Index of row to highlight
         """
         log.debug(f"Highlighting row: {row_index}")
-        from PyQt6.QtCore import QTimer, QPropertyAnimation, QEasingCurve, QAbstractAnimation
+        from PyQt6.QtCore import QTimer
         
         # Get the index for the row
         index = self.model.index(row_index, 0)
@@ -1052,14 +1411,18 @@ class MainWindow(QMainWindow):
         # Scroll to ensure it's visible
         self.table_view.scrollTo(index)
         
-        # Create a transient style sheet for the highlight
-        original_style = self.table_view.styleSheet()
-        
         # Select the row briefly
         self.table_view.selectRow(row_index)
         
-        # Set a timer to clear the selection after a delay
-        QTimer.singleShot(800, lambda: self.table_view.clearSelection())
+        # Clear the selection after a delay. A single restartable timer is
+        # used so a burst of drops coalesces into one clear instead of
+        # queueing a separate timer per drop.
+        if not hasattr(self, '_highlight_timer'):
+            self._highlight_timer = QTimer(self)
+            self._highlight_timer.setSingleShot(True)
+            self._highlight_timer.setInterval(800)
+            self._highlight_timer.timeout.connect(self.table_view.clearSelection)
+        self._highlight_timer.start()
 
     def on_data_changed(self, top_left, bottom_right):
         """
@@ -1091,7 +1454,7 @@ class MainWindow(QMainWindow):
         apply_drag_drop_enhancements(
             self.table_view,
             self.model,
-            self.table_view.itemDelegate()
+            self.table_delegate
         )
         
         # Connect to dataChanged signal for animations
@@ -1099,34 +1462,6 @@ class MainWindow(QMainWindow):
         
         # Add visual feedback when dragging
         self.table_view.setShowGrid(False)  # Ensure grid is off for cleaner look
-        self.table_view.setStyleSheet("""
-            QTableView {
-                background-color: #121212;
-                alternate-background-color: #181818;
-                color: #FFFFFF;
-                border: none;
-                selection-background-color: #333333;
-                selection-color: #FFFFFF;
-                outline: none; /* Remove focus outline */
-            }
-            QTableView::item {
-                padding: 8px;
-                border-bottom: 1px solid #282828;
-            }
-            QTableView::item:selected {
-                background-color: #333333;
-            }
-            QTableView::item:hover {
-                background-color: #282828;
-            }
-            /* Style for drop indicator */
-            QTableView::drop-indicator {
-                background-color: #1DB954;
-                border-radius: 2px;
-                height: 4px;
-                width: 100%;
-            }
-        """)
 
     
     def create_menu_bar(self) -> None:
@@ -1134,63 +1469,33 @@ class MainWindow(QMainWindow):
         log.debug("Creating menu bar")
         menu_bar = self.menuBar()
         
-        # File menu
+        # File menu, built from the declarative action table
         file_menu = menu_bar.addMenu("&File")
+        add_action = file_menu.addAction
+        add_separator = file_menu.addSeparator
         
-        # New action
-        new_action = QAction("&New", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self._new_file)
-        file_menu.addAction(new_action)
-        
-        # Open action
-        open_action = QAction("&Open", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self._open_file)
-        file_menu.addAction(open_action)
-        
-        # Save action
-        save_action = QAction("&Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self._save_file)
-        file_menu.addAction(save_action)
-        
-        # Save As action
-        save_as_action = QAction("Save &As", self)
-        save_as_action.setShortcut("Ctrl+Shift+S")
-        save_as_action.triggered.connect(self._save_file_as)
-        file_menu.addAction(save_as_action)
-        
-        # Add separator
-        file_menu.addSeparator()
-        
-        # Import action
-        import_action = QAction("&Import List...", self)
-        import_action.setShortcut("Ctrl+I")
-        import_action.triggered.connect(self._import_list)
-        file_menu.addAction(import_action)
-        
-        # Export action
-        export_action = QAction("&Export List...", self)
-        export_action.setShortcut("Ctrl+E")
-        export_action.triggered.connect(self._export_list)
-        file_menu.addAction(export_action)
-        
-        # Add separator
-        file_menu.addSeparator()
-        
-        # Recent files submenu
-        self.recent_files_menu = file_menu.addMenu("Recent Files")
-        self._update_recent_files_menu()
-        
-        # Add another separator
-        file_menu.addSeparator()
-        
-        # Exit action
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        for entry in self._FILE_MENU_ACTIONS:
+            if entry is None:
+                add_separator()
+            elif entry == self._RECENT_FILES_ENTRY:
+                # Recent files submenu, populated each time it is opened
+                self.recent_files_menu = file_menu.addMenu("Recent Files")
+                self.recent_files_menu.aboutToShow.connect(self._update_recent_files_menu)
+                self.recent_files_menu.triggered.connect(self._open_recent_file_action)
+                
+                # Fixed entries of the submenu, created once and re-added on
+                # every rebuild. They belong to the window, so clear() only
+                # removes them from the menu instead of deleting them.
+                self._no_recent_files_action = QAction("No recent files", self)
+                self._no_recent_files_action.setEnabled(False)
+                self._clear_recent_files_action = QAction("Clear Recent Files", self)
+                self._clear_recent_files_action.triggered.connect(self._clear_recent_files)
+            else:
+                text, shortcut, handler_name = entry
+                action = QAction(text, self)
+                action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, handler_name))
+                add_action(action)
         
         # View menu
         view_menu = menu_bar.addMenu("&View")
@@ -1209,81 +1514,9 @@ class MainWindow(QMainWindow):
     def apply_theme(self) -> None:
         """Apply the Spotify-like theme to the window and its components."""
         log.debug("Applying Spotify theme")
-        # Use the updated Spotify theme
-        SpotifyTheme.apply_to_window(self)
-        
-        # Additional styling for the Spotify-like components
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #121212;
-            }
-            #mainHeader {
-                background-color: rgba(0, 0, 0, 0.5);
-                border-bottom: 1px solid #333333;
-            }
-            QTableView {
-                background-color: #121212;
-                alternate-background-color: #181818;
-                color: #FFFFFF;
-                border: none;
-                selection-background-color: #333333;
-                selection-color: #FFFFFF;
-            }
-            QTableView::item {
-                padding: 8px;
-                border-bottom: 1px solid #282828;
-            }
-            QTableView::item:selected {
-                background-color: #333333;
-            }
-            QScrollBar:vertical {
-                background-color: #121212;
-                width: 12px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #535353;
-                border-radius: 6px;
-                min-height: 30px;
-                margin: 3px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar:horizontal {
-                background-color: #121212;
-                height: 12px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #535353;
-                border-radius: 6px;
-                min-width: 30px;
-                margin: 3px;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            QStatusBar {
-                background-color: #181818;
-                color: #B3B3B3;
-            }
-            QMenuBar {
-                background-color: #121212;
-                color: #FFFFFF;
-            }
-            QMenuBar::item:selected {
-                background-color: #333333;
-            }
-            QMenu {
-                background-color: #282828;
-                color: #FFFFFF;
-                border: 1px solid #121212;
-            }
-            QMenu::item:selected {
-                background-color: #333333;
-            }
-        """)
+        # The window stylesheet replaces the theme's global one, so it is
+        # handed to the theme rather than parsed and then overwritten
+        SpotifyTheme.apply_to_window(self, _MAIN_WINDOW_STYLESHEET)
 
     def restore_window_state(self) -> None:
         """Restore window size and position from saved configuration."""
@@ -1320,14 +1553,17 @@ class MainWindow(QMainWindow):
         
         # Save maximized state
         is_maximized = self.windowState() & Qt.WindowState.WindowMaximized
-        self.config.set("window/maximized", bool(is_maximized))
+        window_state = {"window/maximized": bool(is_maximized)}
         log.debug(f"Saved maximized state: {bool(is_maximized)}")
         
         # Only save size and position if not maximized
         if not is_maximized:
             log.debug(f"Saved window size: {self.width()}x{self.height()}")
             log.debug(f"Saved window position: ({self.x()}, {self.y()})")
-            self.config.set("window/width", self.width())
-            self.config.set("window/height", self.height())
-            self.config.set("window/position_x", self.x())
-            self.config.set("window/position_y", self.y())
\ No newline at end of file
+            window_state["window/width"] = self.width()
+            window_state["window/height"] = self.height()
+            window_state["window/position_x"] = self.x()
+            window_state["window/position_y"] = self.y()
+        
+        # Set all values together; QSettings writes them out in one go
+        self.config.set_many(window_state)
\ No newline at end of file
@@ -15,6 +15,69 @@ from utils.logging_utils import get_module_logger
 # Get module logger
 log = get_module_logger()
 
+# Spotify-style dark theme stylesheet shared by all dialog instances
+_DIALOG_STYLESHEET = """
+    QDialog {
+        background-color: #121212;
+        color: #FFFFFF;
+    }
+    QLabel {
+        color: #FFFFFF;
+        font-size: 14px;
+    }
+    QLineEdit {
+        background-color: #333333;
+        color: #FFFFFF;
+        border-radius: 4px;
+        padding: 8px;
+        border: 1px solid #444444;
+    }
+    QComboBox {
+        background-color: #333333;
+        color: #FFFFFF;
+        border-radius: 4px;
+        padding: 8px;
+        border: 1px solid #444444;
+        min-width: 200px;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: right center;
+        width: 24px;
+        border-left: none;
+    }
+    QComboBox::down-arrow {
+        width: 14px;
+        height: 14px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #333333;
+        color: #FFFFFF;
+        border: 1px solid #444444;
+        selection-background-color: #505050;
+    }
+    QPushButton {
+        background-color: #1DB954;
+        color: #FFFFFF;
+        border-radius: 4px;
+        padding: 8px 16px;
+        border: none;
+    }
+    QPushButton:hover {
+        background-color: #1ED760;
+    }
+    QPushButton:disabled {
+        background-color: #333333;
+        color: #999999;
+    }
+    QPushButton#cancelButton {
+        background-color: #333333;
+    }
+"""
+
+# Header font shared by all dialog instances
+_HEADER_FONT = QFont("Segoe UI", 16, QFont.Weight.Bold)
+
 
 class NewListDialog(QDialog):
     """Dialog for creating a new album list with collection selection."""
@@ -35,61 +98,7 @@ class NewListDialog(QDialog):
         self.setMinimumWidth(400)
         
         # Set Spotify-style dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #121212;
-                color: #FFFFFF;
-            }
-            QLabel {
-                color: #FFFFFF;
-                font-size: 14px;
-            }
-            QLineEdit {
-                background-color: #333333;
-                color: #FFFFFF;
-                border-radius: 4px;
-                padding: 8px;
-                border: 1px solid #444444;
-            }
-            QComboBox {
-                background-color: #333333;
-                color: #FFFFFF;
-                border-radius: 4px;
-                padding: 8px;
-                border: 1px solid #444444;
-                min-width: 200px;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: right center;
-                width: 24px;
-                border-left: none;
-            }
-            QComboBox::down-arrow {
-                width: 14px;
-                height: 14px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #333333;
-                color: #FFFFFF;
-                border: 1px solid #444444;
-                selection-background-color: #505050;
-            }
-            QPushButton {
-                background-color: #1DB954;
-                color: #FFFFFF;
-                border-radius: 4px;
-                padding: 8px 16px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #1ED760;
-            }
-            QPushButton:disabled {
-                background-color: #333333;
-                color: #999999;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_STYLESHEET)
         
         # Create the layout
         layout = QVBoxLayout(self)
@@ -97,7 +106,7 @@ class NewListDialog(QDialog):
         
         # Header
         header_label = QLabel("Create New List")
-        header_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        header_label.setFont(_HEADER_FONT)
         layout.addWidget(header_label)
         
         # Form layout for fields
@@ -120,8 +129,7 @@ class NewListDialog(QDialog):
         
         # Populate with existing collections
         log.debug("Populating collection dropdown")
-        for name in collection_names:
-            self.collection_combo.addItem(name)
+        self.collection_combo.addItems(collection_names)
             
         # Add "Create new collection..." option
         self.collection_combo.addItem("Create new collection...")
@@ -143,7 +151,7 @@ class NewListDialog(QDialog):
         ok_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
         ok_button.setText("Create")
         cancel_button = button_box.button(QDialogButtonBox.StandardButton.Cancel)
-        cancel_button.setStyleSheet("background-color: #333333;")
+        cancel_button.setObjectName("cancelButton")
         
         layout.addWidget(button_box)
         
@@ -164,14 +172,25 @@ class NewListDialog(QDialog):
             name, ok = QInputDialog.getText(
                 self, "Create Collection", "Collection name:")
             
-            if ok and name:
+            # The "Create new" option's own text is not a usable collection name
+            if ok and name and name != self.collection_combo.itemText(index):
                 log.debug(f"User entered new collection name: {name}")
+                # Select the entry if the name is already listed, letting
+                # the combo box search its model instead of scanning here.
+                # The "Create new" option itself is never a valid match.
+                existing_index = self.collection_combo.findText(
+                    name, Qt.MatchFlag.MatchExactly)
+                if 0 <= existing_index < index:
+                    log.debug(f"Collection already listed at index {existing_index}")
+                    self.collection_combo.setCurrentIndex(existing_index)
+                    return
+                
                 # Insert the new name before the "Create new" option
                 self.collection_combo.insertItem(index, name)
                 self.collection_combo.setCurrentIndex(index)
                 return
                 
-            # If user canceled, revert to first collection
+            # If user canceled or entered no usable name, revert to first collection
             log.debug("User cancelled new collection creation")
             if self.collection_combo.count() > 1:
                 self.collection_combo.setCurrentIndex(0)